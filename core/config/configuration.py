@@ -1,3 +1,4 @@
+import threading
 from typing import Optional
 
 from core.config.environment_setup import EnvironmentSetup
@@ -43,7 +44,7 @@ class _SafeConfig(dict):
         value = super().get(key, default)
 
         if key in self:
-            Logger.debug(f"Retrieved key '{key}': {value!r}")
+            Logger.debug("Retrieved key '%s': %r", key, value)
         elif default is None:
             Logger.error(f"Missing key '{key}' in configuration!")
         else:
@@ -61,9 +62,11 @@ class Config:
     in development mode.
 
     :cvar _instance: Cached :class:`_SafeConfig` instance used throughout the application.
+    :cvar _lock: Guards the first load so concurrent callers never load configuration twice.
     """
 
     _instance: Optional[_SafeConfig] = None
+    _lock = threading.Lock()
 
     @classmethod
     def get(cls) -> _SafeConfig:
@@ -74,12 +77,16 @@ class Config:
         :rtype: _SafeConfig
         """
         if cls._instance is None:
-            environment = EnvironmentSetup()
-            loaded = environment.load()
-
-            # Ensure we return a SafeConfig
-            cls._instance = _SafeConfig(loaded) if not isinstance(loaded, _SafeConfig) else loaded
-            Resources.initialize(cls._instance)
-            Logger.debug("Loaded configuration")
+            with cls._lock:
+                # Re-check under the lock: another thread may have finished loading.
+                if cls._instance is None:
+                    environment = EnvironmentSetup()
+                    loaded = environment.load()
+
+                    # Ensure we return a SafeConfig
+                    instance = _SafeConfig(loaded) if not isinstance(loaded, _SafeConfig) else loaded
+                    Resources.initialize(instance)
+                    cls._instance = instance
+                    Logger.debug("Loaded configuration")
 
         return cls._instance
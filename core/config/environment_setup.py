@@ -7,18 +7,18 @@ It automatically loads and merges values from:
 
 - `config.toml` (always)
 - `.env` (only when running in development mode)
-- Environment variables that override TOML values (dev mode)
+- Environment variables that override `.env` values for keys declared in `.env` (dev mode)
 - Automatic type casting & validation through `ConfigValidator`
 
 It is compatible both with normal development execution and PyInstaller bundles.
 The module also configures logging behavior based on loaded settings.
 """
 
+import functools
 import os
 import sys
 from pathlib import Path
-from typing import Any
-from dotenv import load_dotenv
+from typing import Any, Callable
 
 from core.util.logger import Logger
 from core.util.app_paths import AppPaths
@@ -29,7 +29,7 @@ try:
 except ImportError:
     import tomli as tomllib
 
-from core.util.validator import ConfigValidator
+from core.util.validator import BOOLEAN_FALSE, BOOLEAN_TRUE, ConfigValidator
 
 
 class EnvironmentSetup:
@@ -46,7 +46,8 @@ class EnvironmentSetup:
     - Loads and parses TOML configuration
     - Optionally loads `.env` (dev mode only)
     - Automatically casts types using `ConfigValidator`
-    - Resolves file/directory paths and creates directories if needed
+    - Resolves file/directory paths for `*_PATH`/`*_DIR`/`*_FILE` keys
+      (directories are only created for `*_PATH_CREATE` keys)
     - Configures logging using either `.env` or TOML settings
     - Returns a flattened dictionary of all settings
 
@@ -58,6 +59,32 @@ class EnvironmentSetup:
         Name or path of the TOML config file (default: "config.toml").
     """
 
+    # Parser for every known config key (flattened `config.toml` names); only
+    # keys missing here go through the generic cast rules in `_auto_cast`.
+    _SCHEMA: dict[str, Callable[[str], Any]] = {
+        "APP_NAME": str,
+        "APP_VERSION": str,
+        "APP_DESCRIPTION": str,
+        "APP_AUTHOR": str,
+        "APP_ORGANIZATION": str,
+        "APP_DOMAIN": str,
+        "APP_LANGUAGE": str,
+        "LOGGING_PERSISTENCE_LOGGING": functools.partial(ConfigValidator.ensure_boolean, default=False),
+        "WINDOW_WIDTH": functools.partial(ConfigValidator.ensure_positive_int, default=0),
+        "WINDOW_HEIGHT": functools.partial(ConfigValidator.ensure_positive_int, default=0),
+        "WINDOW_MIN_WIDTH": functools.partial(ConfigValidator.ensure_positive_int, default=0),
+        "WINDOW_MIN_HEIGHT": functools.partial(ConfigValidator.ensure_positive_int, default=0),
+        "WINDOW_TITLE": str,
+        # Validated, but kept as the enum name like the TOML value
+        "WINDOW_THEME_MODE": lambda value: ConfigValidator.parse_theme_mode(value).name,
+        "RESOURCES_BASE": str,
+        "RESOURCES_QSS": str,
+        "RESOURCES_ICONS": str,
+        "RESOURCES_LOCALES": str,
+    }
+    _CREATE_PATH_KEY_SUFFIX = "_PATH_CREATE"
+    _PATH_KEY_SUFFIXES = ("_PATH", "_DIR", "_FILE", _CREATE_PATH_KEY_SUFFIX)
+
     def __init__(self, env_path: str = ".env", toml_path: str = "config.toml"):
         self.validator = ConfigValidator()
 
@@ -79,8 +106,9 @@ class EnvironmentSetup:
 
         # Load .env only if running in dev mode
         self.env_loaded = False
+        self.env_values: dict[str, str] = {}
         if self.is_dev and self.env_path.exists():
-            load_dotenv(dotenv_path=self.env_path)
+            self.env_values = self._load_env_file()
             self.env_loaded = True
             Logger.configure_from_env(self.project_root)
         elif self.is_dev:
@@ -132,17 +160,40 @@ class EnvironmentSetup:
         with open(self.toml_path, "rb") as f:
             return tomllib.load(f)
 
+    def _load_env_file(self) -> dict[str, str]:
+        """
+        Parse the `.env` file and export its values to the process environment.
+
+        Existing environment variables are never overwritten, matching
+        `load_dotenv(override=False)`. Keys declared without a value are skipped.
+
+        Returns
+        -------
+        dict[str, str]
+            The key/value pairs declared in the `.env` file.
+        """
+        # Imported lazily: bundled builds never read `.env`, so they skip loading python-dotenv.
+        from dotenv import dotenv_values
+
+        values = {
+            key: value
+            for key, value in dotenv_values(self.env_path).items()
+            if value is not None
+        }
+        for key, value in values.items():
+            os.environ.setdefault(key, value)
+        return values
+
     def _auto_cast(self, key: str, value: str) -> Any:
         """
         Automatically infer and cast environment variable values to the correct types.
 
-        The method tries the following cast rules:
-        - Special keys:
-            * LOG_LEVEL → parsed using validator.parse_log_level
-            * THEME_MODE → parsed using validator.parse_theme_mode
+        Known keys are parsed by their entry in `_SCHEMA` (a single dispatch;
+        parser errors propagate). Other keys try the following cast rules:
         - Boolean (true/false strings)
         - Positive integer
-        - File or directory path (absolute, validated, directories created if needed)
+        - File or directory path for keys ending in `_PATH`, `_DIR` or `_FILE`
+          (absolute, validated; directories are created only for `_PATH_CREATE` keys)
         - Default: return as string
 
         Parameters
@@ -159,29 +210,28 @@ class EnvironmentSetup:
         """
         v = self.validator
 
-        if key == "LOG_LEVEL":
-            return v.parse_log_level(value)
-        if key == "THEME_MODE":
-            return v.parse_theme_mode(value)
-
-        # Try boolean
-        try:
-            return v.ensure_boolean(value, False, key)
-        except ValueError:
-            pass
-
-        # Try positive integer
-        try:
-            return v.ensure_positive_int(value, 0, key)
-        except ValueError:
-            pass
-
-        # Path auto-handling
-        if any(x in key for x in ("PATH", "DIR", "FILE")):
+        parser = self._SCHEMA.get(key)
+        if parser is not None:
+            return parser(value)
+
+        # Boolean: plain set lookups instead of probing the validator for a ValueError
+        lowered = value.lower()
+        if lowered in BOOLEAN_TRUE:
+            return True
+        if lowered in BOOLEAN_FALSE:
+            return False
+
+        # Positive integer
+        if value.isdecimal() and int(value) > 0:
+            return int(value)
+
+        # Path auto-handling (suffix match, so e.g. APP_PATHS or PATHEXT stay plain strings)
+        if key.endswith(self._PATH_KEY_SUFFIXES):
             p = Path(value).expanduser().resolve()
             if p.suffix:
                 return v.validate_file_path(str(p))
-            return v.validate_directory_path(str(p), create_if_missing=True)
+            create = key.endswith(self._CREATE_PATH_KEY_SUFFIX)
+            return v.validate_directory_path(str(p), create_if_missing=create)
 
         # Default: string
         return v.ensure_string(value, "", key)
@@ -192,7 +242,9 @@ class EnvironmentSetup:
 
         The result includes:
         - Flattened TOML values (e.g. `[app].name` → `APP_NAME`)
-        - .env overrides (dev mode only)
+        - .env overrides (dev mode only); unknown keys and values that fail
+          validation are reported in a single warning each. A rejected value
+          for a `_SCHEMA` key leaves the `config.toml` value in place
         - Auto-casted types for `.env` values
         - A meta-flag `IS_DEV_MODE`
 
@@ -212,17 +264,31 @@ class EnvironmentSetup:
             for key, value in values.items():
                 config[f"{section.upper()}_{key.upper()}"] = value
 
-        # Merge `.env` overrides only for known config keys.
+        # Merge overrides only for known config keys declared in `.env`.
         # This avoids importing unrelated process env vars such as PATH/XDG_*.
         if self.env_loaded:
-            for key in tuple(config.keys()):
-                if key not in os.environ:
+            errors: list[str] = []
+            unknown_keys: list[str] = []
+            for key, env_value in self.env_values.items():
+                if key not in config:
+                    if key not in Logger.ENV_KEYS:
+                        unknown_keys.append(key)
                     continue
-                value = os.environ.get(key)
+                value = os.environ.get(key, env_value)
                 try:
                     config[key] = self._auto_cast(key, value)
-                except Exception:
-                    config[key] = value  # Fallback
+                except Exception as e:
+                    if key in self._SCHEMA:
+                        # The schema declares the type; keep the `config.toml` value
+                        errors.append(f"{key}={value!r}: {e} (kept {config[key]!r})")
+                    else:
+                        errors.append(f"{key}={value!r}: {e} (kept as raw string)")
+                        config[key] = value  # Fallback
+
+            if unknown_keys:
+                Logger.warning(f"Ignoring unknown keys in {self.env_path.name}: {', '.join(unknown_keys)}")
+            if errors:
+                Logger.warning(f"Invalid values in {self.env_path.name}:\n" + "\n".join(errors))
 
         # Add meta flag
         config["IS_DEV_MODE"] = self.is_dev
@@ -1,9 +1,9 @@
-from enum import Enum
+from enum import IntEnum
 
-class LogLevel(Enum):
-    """Logging level enumeration"""
-    DEBUG = "DEBUG"
-    INFO = "INFO"
-    WARNING = "WARNING"
-    ERROR = "ERROR"
-    CRITICAL = "CRITICAL"
\ No newline at end of file
+class LogLevel(IntEnum):
+    """Logging level enumeration, ordered by severity"""
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+    CRITICAL = 50
\ No newline at end of file
@@ -1,3 +1,6 @@
+import functools
+import time
+
 from PySide6.QtCore import Qt, Signal, QObject
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtWidgets import QApplication, QWidget
@@ -21,6 +24,8 @@ class ThemeManager(QObject):
     _config: dict = {}
     _last_system_theme: AppTheme = None  # Track last detected system theme
     _style_initialized = False
+    _light_palette: QPalette = None  # Built on first use, then reused
+    _dark_palette: QPalette = None
 
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
@@ -33,19 +38,30 @@ class ThemeManager(QObject):
         super().__init__()
         self._initialized = True
         ThemeManager._config = config or {}
-        mode = ThemeManager._config.get("WINDOW_THEME_MODE", "AUTO").upper()
-        try:
-            ThemeManager._current_theme = AppTheme(mode) if not isinstance(mode, AppTheme) else mode
-        except ValueError:
+        mode = ThemeManager._config.get("WINDOW_THEME_MODE", AppTheme.AUTO)
+        theme = ThemeManager._coerce_theme(mode)
+        if theme is None:
             Logger.error(f"Unmappable 'WINDOW_THEME_MODE' == '{mode}' in config.")
             Logger.debug("Falling back to LIGHT theme mode.")
-            ThemeManager._current_theme = AppTheme.LIGHT
+            theme = AppTheme.LIGHT
+        ThemeManager._current_theme = theme
 
-        # Detect initial system theme
-        ThemeManager._last_system_theme = AppTheme.DARK if is_system_dark_mode() else AppTheme.LIGHT
+        # Resolve the effective system theme once; refreshed when switching to AUTO
+        ThemeManager._last_system_theme = ThemeManager._detect_system_theme()
 
         ThemeManager._apply_current_theme()
 
+    @staticmethod
+    def _coerce_theme(mode) -> AppTheme | None:
+        """Map a config value (enum or case-insensitive name) to an AppTheme, or None."""
+        if isinstance(mode, AppTheme):
+            return mode
+        return AppTheme.__members__.get(str(mode).strip().upper())
+
+    @staticmethod
+    def _detect_system_theme() -> AppTheme:
+        return AppTheme.DARK if is_system_dark_mode() else AppTheme.LIGHT
+
     # -----------------------
     # Theme Control
     # -----------------------
@@ -76,7 +92,7 @@ class ThemeManager(QObject):
 
             # Update system theme reference when switching to AUTO
             if theme == AppTheme.AUTO:
-                ThemeManager._last_system_theme = AppTheme.DARK if is_system_dark_mode() else AppTheme.LIGHT
+                ThemeManager._last_system_theme = ThemeManager._detect_system_theme()
 
             ThemeManager._apply_current_theme()
             # Emit signal through singleton instance
@@ -229,7 +245,24 @@ class ThemeManager(QObject):
             Logger.error("QApplication instance not found. Cannot apply theme.")
             return
 
-        light_palette = ThemeManager._build_palette(
+        if ThemeManager._light_palette is None:
+            ThemeManager._light_palette = ThemeManager._build_light_palette()
+        app.setPalette(ThemeManager._light_palette)
+
+    @staticmethod
+    def _apply_dark_palette():
+        app = QApplication.instance()
+        if not app:
+            Logger.error("QApplication instance not found. Cannot apply theme.")
+            return
+
+        if ThemeManager._dark_palette is None:
+            ThemeManager._dark_palette = ThemeManager._build_dark_palette()
+        app.setPalette(ThemeManager._dark_palette)
+
+    @staticmethod
+    def _build_light_palette() -> QPalette:
+        return ThemeManager._build_palette(
             window=QColor("#f3f5f7"),
             window_text=QColor("#1f2933"),
             base=QColor("#ffffff"),
@@ -249,16 +282,9 @@ class ThemeManager(QObject):
             disabled_text=QColor("#b1b7c2"),
         )
 
-        app.setPalette(light_palette)
-
     @staticmethod
-    def _apply_dark_palette():
-        app = QApplication.instance()
-        if not app:
-            Logger.error("QApplication instance not found. Cannot apply theme.")
-            return
-
-        dark_palette = ThemeManager._build_palette(
+    def _build_dark_palette() -> QPalette:
+        return ThemeManager._build_palette(
             window=QColor("#1f242b"),
             window_text=QColor("#eef1f5"),
             base=QColor("#151a20"),
@@ -278,8 +304,6 @@ class ThemeManager(QObject):
             disabled_text=QColor("#738091"),
         )
 
-        app.setPalette(dark_palette)
-
     @staticmethod
     def get_current_theme() -> AppTheme:
         """Get the current theme (static)."""
@@ -305,8 +329,21 @@ class ThemeManager(QObject):
 # -----------------------
 # System Theme Detection
 # -----------------------
+SYSTEM_THEME_CACHE_SECONDS = 5
+
+
 def is_system_dark_mode() -> bool:
-    """Detect whether the operating system currently prefers a dark theme."""
+    """
+    Detect whether the operating system currently prefers a dark theme.
+
+    The result is reused for up to ``SYSTEM_THEME_CACHE_SECONDS`` so repeated
+    theme switches do not spawn a detection subprocess every time.
+    """
+    return _detect_system_dark_mode(int(time.monotonic() // SYSTEM_THEME_CACHE_SECONDS))
+
+@functools.lru_cache(maxsize=1)
+def _detect_system_dark_mode(_time_bucket: int) -> bool:
+    """Run the platform-specific detection; cached per time bucket."""
     if IS_MACOS:
         return detect_macos_theme()
     if IS_WINDOWS:
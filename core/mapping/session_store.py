@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 import shutil
@@ -250,14 +251,19 @@ class ProjectSessionStore:
             if relative_path
         }
 
-        for candidate in templates_dir.rglob("*"):
-            if candidate.is_file() and str(candidate.resolve()) not in expected_paths:
-                candidate.unlink(missing_ok=True)
-
-        for candidate in sorted(templates_dir.rglob("*"), key=lambda path: len(path.parts), reverse=True):
-            if candidate.is_dir():
+        # Single bottom-up scandir walk: drop stale files, then prune directories left empty.
+        root = str(templates_dir)
+        for dirpath, _dirnames, filenames in os.walk(root, topdown=False):
+            for file_name in filenames:
+                candidate = os.path.join(dirpath, file_name)
+                if os.path.realpath(candidate) not in expected_paths:
+                    try:
+                        os.unlink(candidate)
+                    except FileNotFoundError:
+                        pass
+            if dirpath != root:
                 try:
-                    candidate.rmdir()
+                    os.rmdir(dirpath)
                 except OSError:
                     pass
 
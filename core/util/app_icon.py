@@ -151,15 +151,16 @@ def configure_qt_application_identity(
 def resolve_app_icon_paths() -> list[Path]:
     """Return candidate icon paths from resources for runtime icon setup."""
     candidates: list[Path] = []
-    get_icon = getattr(Resources, "get_in_icons", None)
-    if callable(get_icon):
-        resolved = get_icon("document-mapper.ico", suppress=True)
+    if Resources.has("icons"):
+        resolved = Resources.get_in("icons", "document-mapper.ico", suppress=True)
         if resolved:
+            # Hits come from the resource index, so the file is known to exist
             candidates.append(Path(resolved).expanduser().resolve())
+            return candidates
 
     resources_icons = AppPaths.resource_root("resources") / "icons"
     candidate = (resources_icons / "document-mapper.ico").resolve()
-    if candidate.exists() and candidate not in candidates:
+    if candidate.exists():
         candidates.append(candidate)
     return candidates
 
@@ -170,10 +171,12 @@ def resolve_app_icon_path() -> Path | None:
     return candidates[0] if candidates else None
 
 
-def build_app_icon() -> QIcon | None:
-    """Build a QIcon from all available icon candidates."""
+def build_app_icon(icon_paths: list[Path] | None = None) -> QIcon | None:
+    """Build a QIcon from all available icon candidates (resolved here unless given)."""
+    if icon_paths is None:
+        icon_paths = resolve_app_icon_paths()
     icon = QIcon()
-    for path in resolve_app_icon_paths():
+    for path in icon_paths:
         icon.addFile(str(path))
     return None if icon.isNull() else icon
 
@@ -239,9 +242,13 @@ def ensure_linux_desktop_integration(
 
 
 def _should_refresh_launcher_icon(source_icon: Path, target_path: Path) -> bool:
-    if not target_path.exists() or target_path.stat().st_size <= 0:
+    try:
+        target_stat = target_path.stat()
+    except OSError:
+        return True
+    if target_stat.st_size <= 0:
         return True
-    return target_path.stat().st_mtime < source_icon.stat().st_mtime
+    return target_stat.st_mtime < source_icon.stat().st_mtime
 
 
 def _render_launcher_png(source_icon: Path, target_png: Path):
@@ -268,7 +275,7 @@ def apply_app_icon_setup(
         icon_paths,
         entrypoint_path=entrypoint_path,
     )
-    icon = build_app_icon()
+    icon = build_app_icon(icon_paths)
     if icon is not None:
         app.setWindowIcon(icon)
     return icon
@@ -1,6 +1,8 @@
+import atexit
 import os
 import platform
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -17,10 +19,25 @@ class Logger:
 
     CONSOLE_OUTPUT_ENABLED: bool = False
     LEVEL: LogLevel = LogLevel.INFO
+    # Integer threshold for the hot-path check; above every level while no sink is active
+    _MIN_LEVEL: int = LogLevel.CRITICAL + 1
     PERSISTENCE_LOGGING: bool = False
     LOG_FILE_PATH: Path = Path(log_file_name)
     CONSOLE_FORCE_COLORED: bool = False
 
+    # Environment variables read by configure_from_env()
+    ENV_KEYS = frozenset({
+        "CONSOLE_OUTPUT_ENABLED",
+        "CONSOLE_OUTPUT_LEVEL",
+        "CONSOLE_FORCE_COLORED",
+        "PERSISTENCE_LOGGING",
+        "PERSISTENCE_LOGGING_TARGET_NAME",
+    })
+
+    _log_file = None  # Long-lived, line-buffered handle to LOG_FILE_PATH
+    _close_registered: bool = False
+    _timestamp_cache: tuple[int, str] = (-1, "")  # (epoch second, formatted timestamp)
+
     _COLORS = {
         LogLevel.DEBUG: "\033[38;5;213m",    # soft magenta
         LogLevel.INFO: "\033[38;5;39m",      # blue
@@ -30,13 +47,9 @@ class Logger:
     }
     RESET = "\033[0m"
 
-    _PRIORITY = {
-        LogLevel.DEBUG: 10,
-        LogLevel.INFO: 20,
-        LogLevel.WARNING: 30,
-        LogLevel.ERROR: 40,
-        LogLevel.CRITICAL: 50,
-    }
+    # Per-level "%"-templates taking (timestamp, message); see _build_line_formats()
+    _CONSOLE_FORMATS: dict[LogLevel, str] = {}
+    _FILE_FORMATS: dict[LogLevel, str] = {}
 
     @classmethod
     def _get_app_root(cls) -> Path:
@@ -71,19 +84,26 @@ class Logger:
             log_level_name = os.getenv("CONSOLE_OUTPUT_LEVEL", "INFO").upper()
             cls.LEVEL = LogLevel.__members__.get(log_level_name, LogLevel.INFO)
             cls.PERSISTENCE_LOGGING = False
+        cls._MIN_LEVEL = int(cls.LEVEL)
+        if not (cls.CONSOLE_OUTPUT_ENABLED or cls.PERSISTENCE_LOGGING):
+            # No sink is active: lift the threshold above every level so all calls return immediately
+            cls._MIN_LEVEL = LogLevel.CRITICAL + 1
 
         # Determine log file path
         cls.LOG_FILE_PATH = (project_root / cls.log_file_name).resolve()
 
         # Auto-create log directory
+        cls._close_log_file()
         if cls.PERSISTENCE_LOGGING:
             cls.LOG_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
             cls._write_file_header()
+            cls._open_log_file()
 
         # Disable colors if not a TTY and FORCE_COLOR not set
         if not sys.stdout.isatty() and not cls.CONSOLE_FORCE_COLORED:
             cls._COLORS = {level: "" for level in cls._COLORS}
             cls.RESET = ""
+        cls._build_line_formats()
 
         cls.debug("Logger configured successfully.")
 
@@ -120,34 +140,74 @@ class Logger:
             if cls.CONSOLE_OUTPUT_ENABLED:
                 Logger.log(f"[LoggerError] Failed to write log file header: {e}", LogLevel.ERROR)
 
+    # ---------------------------
+    # Log File Handle
+    # ---------------------------
+    @classmethod
+    def _open_log_file(cls):
+        """Open the log file once for appending; lines are flushed as they are written."""
+        try:
+            cls._log_file = open(cls.LOG_FILE_PATH, "a", encoding="utf-8", buffering=1)
+        except Exception as e:
+            cls._log_file = None
+            if cls.CONSOLE_OUTPUT_ENABLED:
+                print(f"!!! - LoggerError: Failed to open log file: {e}")
+            return
+
+        if not cls._close_registered:
+            atexit.register(cls._close_log_file)
+            cls._close_registered = True
+
+    @classmethod
+    def _close_log_file(cls):
+        """Close the current log file handle, if any."""
+        if cls._log_file is not None:
+            try:
+                cls._log_file.close()
+            except Exception:
+                pass
+            cls._log_file = None
+
     # ---------------------------
     # Core Logging
     # ---------------------------
     @classmethod
-    def _enabled_for(cls, level: LogLevel) -> bool:
-        """Return True if the log level is >= current filter."""
-        return cls._PRIORITY.get(level, 0) >= cls._PRIORITY.get(cls.LEVEL, 0)
+    def _build_line_formats(cls):
+        """Precompute the colored console and plain file line templates for every level."""
+        cls._CONSOLE_FORMATS = {}
+        cls._FILE_FORMATS = {}
+        for level in LogLevel:
+            color = cls._COLORS.get(level, "")
+            reset = cls.RESET if color else ""
+            cls._CONSOLE_FORMATS[level] = color + "[%s] [" + level.name + "] %s" + reset
+            cls._FILE_FORMATS[level] = "[%s] [" + level.name + "] %s\n"
+
+    @classmethod
+    def _timestamp(cls) -> str:
+        """Return the current local time, formatted once per second."""
+        now = int(time.time())
+        cached_second, cached_text = cls._timestamp_cache
+        if now != cached_second:
+            cached_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            cls._timestamp_cache = (now, cached_text)
+        return cached_text
 
     @classmethod
     def log(cls, message: str, level: LogLevel = LogLevel.INFO):
         """Logs a message to console and optionally to file."""
-        if not cls._enabled_for(level):
+        if level < cls._MIN_LEVEL:
             return
 
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        plain_text = f"[{timestamp}] [{level.name}] {message}"
+        timestamp = cls._timestamp()
 
         # Console output (colored)
         if cls.CONSOLE_OUTPUT_ENABLED:
-            color = cls._COLORS.get(level, "")
-            reset = cls.RESET if color else ""
-            print(f"{color}{plain_text}{reset}")
+            print(cls._CONSOLE_FORMATS[level] % (timestamp, message))
 
         # File output (no colors)
-        if cls.PERSISTENCE_LOGGING:
+        if cls.PERSISTENCE_LOGGING and cls._log_file is not None:
             try:
-                with open(cls.LOG_FILE_PATH, "a", encoding="utf-8") as f:
-                    f.write(plain_text + "\n")
+                cls._log_file.write(cls._FILE_FORMATS[level] % (timestamp, message))
             except Exception as e:
                 if cls.CONSOLE_OUTPUT_ENABLED:
                     print(f"!!! - LoggerError: Failed to write to log file: {e}")
@@ -155,6 +215,9 @@ class Logger:
     # ---------------------------
     # Convenience Shortcuts
     # ---------------------------
+    # The shortcuts check the level before resolving the caller tag or
+    # interpolating ``%``-style ``args``, so filtered-out calls stay cheap:
+    #   Logger.debug("Indexed %d files from %s", count, path)
 
     @classmethod
     def _format_message(cls, msg: str, tag=None) -> str:
@@ -186,80 +249,113 @@ class Logger:
         return f"[{tag}] {msg}"
 
     @classmethod
-    def debug(cls, msg: str, tag=None):
+    def debug(cls, msg: str, *args, tag=None):
         """
         Log a debug-level message.
 
 
-        :param msg: The message to log.
+        :param msg: The message to log, optionally a ``%``-style format string.
+        :param args: Values interpolated into ``msg`` only if the level is enabled.
         :param tag: Custom tag to prefix the log message.
                 If not provided, the tag defaults to the caller's class name
                 or module name.
         """
+        if LogLevel.DEBUG < cls._MIN_LEVEL:
+            return
+        if args:
+            msg = msg % args
         cls.log(cls._format_message(msg, tag), LogLevel.DEBUG)
 
     @classmethod
-    def info(cls, msg: str, tag=None):
+    def info(cls, msg: str, *args, tag=None):
         """
         Log an informational message.
 
-        :param msg: The message to log.
+        :param msg: The message to log, optionally a ``%``-style format string.
+        :param args: Values interpolated into ``msg`` only if the level is enabled.
         :param tag: Custom tag to prefix the log message.
                 If not provided, the tag defaults to the caller's class name
                 or module name.
         """
+        if LogLevel.INFO < cls._MIN_LEVEL:
+            return
+        if args:
+            msg = msg % args
         cls.log(cls._format_message(msg, tag), LogLevel.INFO)
 
     @classmethod
-    def warning(cls, msg: str, tag=None):
+    def warning(cls, msg: str, *args, tag=None):
         """
         Log a warning message.
 
 
-        :param msg: The message to log.
+        :param msg: The message to log, optionally a ``%``-style format string.
+        :param args: Values interpolated into ``msg`` only if the level is enabled.
         :param tag: Custom tag to prefix the log message.
                 If not provided, the tag defaults to the caller's class name
                 or module name.
         """
+        if LogLevel.WARNING < cls._MIN_LEVEL:
+            return
+        if args:
+            msg = msg % args
         cls.log(cls._format_message(msg, tag), LogLevel.WARNING)
 
     @classmethod
-    def error(cls, msg: str, tag=None):
+    def error(cls, msg: str, *args, tag=None):
         """
         Log an error message.
 
 
-        :param msg: The message to log.
+        :param msg: The message to log, optionally a ``%``-style format string.
+        :param args: Values interpolated into ``msg`` only if the level is enabled.
         :param tag: Custom tag to prefix the log message.
                 If not provided, the tag defaults to the caller's class name
                 or module name.
         """
+        if LogLevel.ERROR < cls._MIN_LEVEL:
+            return
+        if args:
+            msg = msg % args
         cls.log(cls._format_message(msg, tag), LogLevel.ERROR)
 
     @classmethod
-    def critical(cls, msg: str, tag=None):
+    def critical(cls, msg: str, *args, tag=None):
         """
         Log a critical (highest-severity) message.
 
 
-        :param msg: The message to log.
+        :param msg: The message to log, optionally a ``%``-style format string.
+        :param args: Values interpolated into ``msg`` only if the level is enabled.
         :param tag: Custom tag to prefix the log message.
                 If not provided, the tag defaults to the caller's class name
                 or module name.
         """
+        if LogLevel.CRITICAL < cls._MIN_LEVEL:
+            return
+        if args:
+            msg = msg % args
         cls.log(cls._format_message(msg, tag), LogLevel.CRITICAL)
 
     @classmethod
-    def exception(cls, msg: str, tag=None):
+    def exception(cls, msg: str, *args, tag=None):
         """
         Log an ERROR message including the full traceback of the current exception.
         Should only be used inside an except block.
 
-        :param msg: The message to log.
+        :param msg: The message to log, optionally a ``%``-style format string.
+        :param args: Values interpolated into ``msg`` only if the level is enabled.
         :param tag: Custom tag to prefix the log message.
                 If not provided, the tag defaults to the caller's class name
                 or module name.
         """
+        if LogLevel.ERROR < cls._MIN_LEVEL:
+            return
         import traceback
+        if args:
+            msg = msg % args
         full_msg = f"{msg}\n{traceback.format_exc()}"
         cls.error(full_msg, tag=tag)
+
+
+Logger._build_line_formats()
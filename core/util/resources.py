@@ -1,6 +1,6 @@
+import os
 import sys
 from pathlib import Path
-from types import MethodType
 from typing import Optional
 
 from core.util.app_paths import AppPaths
@@ -9,7 +9,7 @@ from core.util.logger import Logger
 
 class Resources:
     """
-    Dynamic resource manager for handling application assets in both development
+    Resource manager for handling application assets in both development
     and bundled environments (e.g., PyInstaller).
 
     This class provides a centralized way to access and manage application
@@ -20,10 +20,10 @@ class Resources:
     Features:
     -----------
     - Resolves base paths depending on environment (dev vs bundled).
-    - Indexes all files in resource directories for fast access.
-    - Provides dynamic getter methods:
-        - get_in_<resource>(filename_or_path): returns the absolute path to a resource.
-        - get_all_in_<resource>(): returns all files for a given resource type.
+    - Indexes files in a resource directory lazily, on first access.
+    - Provides lookups keyed by resource type (``kind``, e.g. ``"icons"``):
+        - get_in(kind, filename_or_path): returns the absolute path to a resource.
+        - get_all_in(kind): returns all files for a given resource type.
     - Automatically creates configured directories in development mode (except `images`).
     - Logs errors and warnings when resources are missing or misconfigured.
 
@@ -31,8 +31,12 @@ class Resources:
     -----------
     _cfg : dict
         Stores the normalized resource configuration loaded from application config.
+    _dirs : dict
+        Absolute directory for each configured resource type (including ``base``).
     _resources : dict
-        Indexed list of all files for each resource type.
+        Indexed list of all files for each resource type that has been accessed.
+    _lookups : dict
+        Per resource type, maps relative paths and unambiguous file names to absolute paths.
     _is_bundled : bool
         True if the application is running as a frozen/bundled executable.
 
@@ -42,19 +46,27 @@ class Resources:
         Returns the base path for resources depending on environment.
     _list_files(directory: str) -> list[str]
         Recursively lists all files in the given directory.
-    _create_get_all_method(name: str)
-        Dynamically creates get_all_<name>() method for accessing all files.
-    _create_get_method(name: str)
-        Dynamically creates get_<name>(filename_or_path) method for accessing a single file.
+    _index(kind: str) -> list[str]
+        Returns the file index for a resource type, building it on first use.
+    _lookup(kind: str) -> dict[str, str]
+        Returns the relative-path/file-name lookup table for a resource type.
     initialize(cfg: Optional[dict] = None)
-        Initializes the resource manager with configuration, indexes all files,
-        creates getter methods, and prepares directories if needed.
+        Initializes the resource manager with configuration and prepares
+        directories if needed.
+    has(kind: str) -> bool
+        Returns True if the resource type is configured.
+    get_in(kind: str, path: str, suppress: bool = False) -> Optional[str]
+        Returns the absolute path to a single resource.
+    get_all_in(kind: str) -> list[str]
+        Returns all files for a resource type.
     get_all() -> dict[str, list[str]]
-        Returns the dictionary of all indexed resources.
+        Returns the dictionary of all indexed resources, indexing any pending types.
     """
 
     _cfg = {}
+    _dirs = {}
     _resources = {}
+    _lookups = {}
     _is_bundled = getattr(sys, 'frozen', False)
     _base_path = None
     _resource_key: str = "resources"
@@ -67,56 +79,63 @@ class Resources:
 
     @classmethod
     def _list_files(cls, directory: str) -> list[str]:
-        """Recursively list all files in a directory."""
-        path = Path(directory)
-        if not path.exists():
-            return []
-        return [str(p) for p in path.rglob("*") if p.is_file()]
+        """
+        Recursively list all files in a directory using ``os.scandir``.
+
+        ``DirEntry`` type checks reuse the metadata returned by the directory
+        listing, so no extra ``stat`` call is needed per entry. Missing or
+        unreadable directories are skipped.
+        """
+        files: list[str] = []
+        pending = [str(directory)]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            files.append(entry.path)
+            except OSError:
+                continue
+        return files
 
     @classmethod
-    def _create_get_all_method(cls, name: str):
-        """Create get_all_in_<name>()"""
-
-        def method(self_or_cls):
-            return cls._resources.get(name, [])
-
-        method.__name__ = f"get_all_in_{name}"
-        setattr(cls, method.__name__, MethodType(method, cls))
+    def _index(cls, kind: str) -> list[str]:
+        """Return the file index for ``kind``, scanning its directory on first access."""
+        files = cls._resources.get(kind)
+        if files is None:
+            directory = cls._dirs[kind]
+            files = cls._resources[kind] = cls._list_files(directory)
+            Logger.debug("Indexed %d %s files from: %s", len(files), kind, directory)
+        return files
 
     @classmethod
-    def _create_get_method(cls, name: str):
-        """Create get_in_<name>(filename_or_path)"""
-
-        def method(self_or_cls, path: str, suppress: bool = False):
-            p = Path(path)
-
-            # Absolute or already-existing path
-            if p.exists():
-                return str(p.resolve())
-
-            base_path = Path(getattr(cls, name))
-
-            candidate = base_path / path
-            if candidate.exists():
-                return str(candidate.resolve())
-
-            if cls._is_bundled:
-                bundled_candidate = cls._get_base_path() / path
-                if bundled_candidate.exists():
-                    return str(bundled_candidate.resolve())
-
-            if not suppress:
-                Logger.error(f"Resource not found: {path}")
-                raise FileNotFoundError(f"Resource not found: {path}")
-
-            return None
-
-        method.__name__ = f"get_in_{name}"
-        setattr(cls, method.__name__, classmethod(method))
+    def _lookup(cls, kind: str) -> dict[str, str]:
+        """
+        Return a table mapping resource-relative paths (``/``-separated) and
+        file names to absolute paths. File names shared by several files are
+        left out so they never resolve to an arbitrary match.
+        """
+        table = cls._lookups.get(kind)
+        if table is None:
+            base = cls._dirs[kind]
+            table = {}
+            by_name: dict[str, str | None] = {}
+            for abs_path in cls._index(kind):
+                table[os.path.relpath(abs_path, base).replace(os.sep, "/")] = abs_path
+                file_name = os.path.basename(abs_path)
+                by_name[file_name] = None if file_name in by_name else abs_path
+            for file_name, abs_path in by_name.items():
+                if abs_path is not None:
+                    table.setdefault(file_name, abs_path)
+            cls._lookups[kind] = table
+        return table
 
     @classmethod
     def initialize(cls, cfg: Optional[dict] = None):
-        """Initialize resource directories/indexes and create dynamic getter methods."""
+        """Initialize resource directories for every configured resource type."""
         if cfg is not None:
             cls._cfg = {
                 k.replace("RESOURCES_", "").lower(): v
@@ -131,9 +150,11 @@ class Resources:
 
         base_path = cls._get_base_path()
 
+        # Single pass: resolve each directory once and create it if needed (dev only)
+        dirs = {}
         for key, path in cls._cfg.items():
             if key == "base":
-                setattr(cls, key, str(base_path))
+                dirs[key] = str(base_path)
                 continue
 
             if cls._is_bundled:
@@ -143,18 +164,74 @@ class Resources:
                 abs_path = p if p.is_absolute() else base_path / p.name
                 if key != "images":
                     abs_path.mkdir(parents=True, exist_ok=True)
+            # Same normalisation as the get_in fallbacks, so index hits and misses agree
+            dirs[key] = str(abs_path.resolve())
 
-            abs_path = abs_path.resolve()
-            setattr(cls, key, str(abs_path))
+        # Publish the new directories together; files are indexed on first lookup
+        cls._dirs.update(dirs)
+        for key in dirs:
+            cls._resources.pop(key, None)
+            cls._lookups.pop(key, None)
+        resource_count = sum(1 for key in dirs if key != "base")
+        Logger.debug("Configured %d resource types under: %s", resource_count, base_path)
 
-            # Index files
-            cls._resources[key] = cls._list_files(abs_path)
-            cls._create_get_all_method(key)
-            cls._create_get_method(key)
+    @classmethod
+    def has(cls, kind: str) -> bool:
+        """Return True if ``kind`` is a configured resource type."""
+        return kind in cls._dirs and kind != "base"
+
+    @classmethod
+    def get_in(cls, kind: str, path: str, suppress: bool = False) -> Optional[str]:
+        """
+        Return the absolute path of ``path`` within the ``kind`` resource directory.
+
+        :param kind: Resource type, e.g. ``"icons"`` or ``"qss"``.
+        :param path: File name or path relative to the resource directory (or absolute).
+        :param suppress: Return ``None`` instead of raising when the resource is missing.
+        :raises FileNotFoundError: If the resource cannot be found and ``suppress`` is False.
+        """
+        if not cls.has(kind):
+            if not suppress:
+                Logger.error(f"Unknown resource type: {kind}")
+                raise FileNotFoundError(f"Unknown resource type: {kind}")
+            return None
+
+        hit = cls._lookup(kind).get(str(path).replace("\\", "/"))
+        if hit is not None:
+            return hit
+
+        p = Path(path)
 
-            Logger.debug(f"Indexed {len(cls._resources[key])} {key} files from: {abs_path}")
+        # Absolute or already-existing path
+        if p.exists():
+            return str(p.resolve())
+
+        candidate = Path(cls._dirs[kind]) / path
+        if candidate.exists():
+            return str(candidate.resolve())
+
+        if cls._is_bundled:
+            bundled_candidate = cls._get_base_path() / path
+            if bundled_candidate.exists():
+                return str(bundled_candidate.resolve())
+
+        if not suppress:
+            Logger.error(f"Resource not found: {path}")
+            raise FileNotFoundError(f"Resource not found: {path}")
+
+        return None
+
+    @classmethod
+    def get_all_in(cls, kind: str) -> list[str]:
+        """Return all indexed files for ``kind`` (empty if the type is not configured)."""
+        if not cls.has(kind):
+            return []
+        return cls._index(kind)
 
     @classmethod
     def get_all(cls) -> dict[str, list[str]]:
         """Return the dict of all indexed resources."""
+        for kind in cls._dirs:
+            if kind != "base":
+                cls._index(kind)
         return cls._resources
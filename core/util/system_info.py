@@ -1,8 +1,11 @@
+import configparser
 import os
 import platform
 import subprocess
+from pathlib import Path
 
 from core.util.logger import Logger
+from core.util.validator import BOOLEAN_FALSE, BOOLEAN_TRUE
 
 def detect_os_name() -> str:
     """Detect the current operating system name."""
@@ -26,16 +29,20 @@ def detect_macos_theme() -> bool:
         return False
 
 
+_windows_personalize_key = None
+
+
 def detect_windows_theme() -> bool:
-    """Detect dark mode on Windows."""
+    """Detect dark mode on Windows (the registry key is opened once and reused)."""
+    global _windows_personalize_key
     try:
         import winreg
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize"
-        )
-        val, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-        winreg.CloseKey(key)
+        if _windows_personalize_key is None:
+            _windows_personalize_key = winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER,
+                r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize"
+            )
+        val, _ = winreg.QueryValueEx(_windows_personalize_key, "AppsUseLightTheme")
         return val == 0
     except Exception as e:
         Logger.warning(f"Windows theme detection failed: {e}")
@@ -43,7 +50,17 @@ def detect_windows_theme() -> bool:
 
 
 def detect_linux_theme() -> bool:
-    """Detect dark theme from GTK/KDE."""
+    """
+    Detect dark theme on Linux.
+
+    Cheap in-process sources are tried first (Qt's style hints, ``$GTK_THEME``,
+    the GTK 3 ``settings.ini``); the GTK/KDE command-line tools are only
+    spawned when none of them gives an answer.
+    """
+    for source in (_detect_qt_color_scheme_dark, _detect_gtk_env_dark, _detect_gtk_settings_dark):
+        result = source()
+        if result is not None:
+            return result
     if _detect_gtk_dark():
         return True
     if _detect_kde_dark():
@@ -51,6 +68,62 @@ def detect_linux_theme() -> bool:
     return False
 
 
+def _detect_qt_color_scheme_dark() -> bool | None:
+    """Read the color scheme Qt (6.5+) reports; None if unknown or unavailable."""
+    try:
+        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QGuiApplication
+    except ImportError:
+        return None
+    if QGuiApplication.instance() is None:
+        return None
+    color_scheme_enum = getattr(Qt, "ColorScheme", None)
+    style_hints = QGuiApplication.styleHints()
+    if color_scheme_enum is None or not hasattr(style_hints, "colorScheme"):
+        return None
+    scheme = style_hints.colorScheme()
+    if scheme == color_scheme_enum.Dark:
+        return True
+    if scheme == color_scheme_enum.Light:
+        return False
+    return None
+
+
+def _detect_gtk_env_dark() -> bool | None:
+    """Check ``$GTK_THEME`` (e.g. ``Adwaita:dark``); None unless it names a dark theme."""
+    gtk_theme = os.environ.get("GTK_THEME", "").strip().lower()
+    return True if "dark" in gtk_theme else None
+
+
+def _detect_gtk_settings_dark() -> bool | None:
+    """
+    Read the GTK 3 ``settings.ini``.
+
+    Only an explicit ``gtk-application-prefer-dark-theme`` is a final answer; a
+    dark ``gtk-theme-name`` counts as dark. Anything else returns None so the
+    gsettings ``color-scheme`` check (GNOME 42+ ``prefer-dark``) still runs.
+    """
+    config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    settings_file = Path(config_home) / "gtk-3.0" / "settings.ini"
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        if not parser.read(settings_file, encoding="utf-8") or not parser.has_section("Settings"):
+            return None
+    except Exception as e:
+        Logger.warning(f"GTK settings.ini could not be read: {e}")
+        return None
+
+    settings = parser["Settings"]
+    prefer_dark = settings.get("gtk-application-prefer-dark-theme", "").strip().lower()
+    if prefer_dark in BOOLEAN_TRUE:
+        return True
+    if prefer_dark in BOOLEAN_FALSE:
+        return False
+    if "dark" in settings.get("gtk-theme-name", "").lower():
+        return True
+    return None
+
+
 def _detect_gtk_dark() -> bool:
     """Detect dark mode in GTK-based environments (like GNOME)."""
     try:
@@ -4,6 +4,11 @@ from typing import Any
 from core.enums.app_themes import AppTheme
 from core.enums.log_level import LogLevel
 
+# Accepted (lower-case) spellings for boolean configuration values
+BOOLEAN_TRUE = frozenset({"true", "yes", "1", "on"})
+BOOLEAN_FALSE = frozenset({"false", "no", "0", "off"})
+
+
 class ConfigValidator:
     """
     Validation and type-conversion utilities for configuration values.
@@ -47,9 +52,10 @@ class ConfigValidator:
         if isinstance(value, bool):
             return value
         if isinstance(value, str):
-            if value.lower() in ('true', 'yes', '1', 'on'):
+            lowered = value.lower()
+            if lowered in BOOLEAN_TRUE:
                 return True
-            elif value.lower() in ('false', 'no', '0', 'off'):
+            if lowered in BOOLEAN_FALSE:
                 return False
         raise ValueError(f"Invalid {field_name}: {value}")
 
@@ -76,10 +82,10 @@ class ConfigValidator:
         :returns: LogLevel enum instance.
         :raises ValueError: If the string is not a valid log level.
         """
-        try:
-            return LogLevel(level.upper())
-        except ValueError:
+        log_level = LogLevel.__members__.get(str(level).strip().upper())
+        if log_level is None:
             raise ValueError(f"Invalid log level: {level}")
+        return log_level
 
     @staticmethod
     def parse_theme_mode(mode: str) -> AppTheme:
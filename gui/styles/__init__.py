@@ -1,28 +1,35 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 from core.util.app_paths import AppPaths
 from core.util.resources import Resources
 
 
+@functools.lru_cache(maxsize=1)
 def _combo_arrow_path() -> str:
-    getter = getattr(Resources, "get_in_icons", None)
-    if getter is not None:
-        resolved = getter("sys/chevron_down.svg", suppress=True)
+    """Resolve the combo-box arrow icon once; every stylesheet reuses the path."""
+    if Resources.has("icons"):
+        resolved = Resources.get_in("icons", "sys/chevron_down.svg", suppress=True)
         if resolved:
             return Path(resolved).resolve().as_posix()
     return (AppPaths.resource_root("resources") / "icons" / "sys" / "chevron_down.svg").as_posix()
 
 
+@functools.lru_cache(maxsize=None)
+def _read_stylesheet(path: str) -> str:
+    """Read a QSS file once; every page sharing a stylesheet reuses the text."""
+    return Path(path).read_text(encoding="utf-8")
+
+
 def load_stylesheet(name: str) -> str:
     """Load a QSS file by logical name and inject runtime asset placeholders."""
-    getter = getattr(Resources, "get_in_qss", None)
-    if getter is not None:
-        path = Path(getter(f"{name}.qss"))
+    if Resources.has("qss"):
+        path = Path(Resources.get_in("qss", f"{name}.qss"))
     else:
         path = AppPaths.resource_root("resources") / "qss" / f"{name}.qss"
-    qss = path.read_text(encoding="utf-8")
+    qss = _read_stylesheet(str(path))
     return qss.replace("__COMBO_ARROW_PATH__", _combo_arrow_path())
 
 
@@ -24,6 +24,7 @@ class SidebarStageCard(QFrame):
         self.setProperty("completed", False)
         self.setProperty("blocked", False)
         self._blocked = False
+        self._state_flags = (False, False, False)  # (active, completed, blocked) as last applied
         self.setCursor(Qt.PointingHandCursor)
         self.setMinimumHeight(82)
 
@@ -66,6 +67,10 @@ class SidebarStageCard(QFrame):
 
     def set_stage_state(self, state: WorkflowStageState):
         """Apply stage flags and repolish widgets to reflect current state."""
+        state_flags = (state.active, state.completed, state.blocked)
+        if state_flags == self._state_flags:
+            return
+        self._state_flags = state_flags
         self._blocked = state.blocked
         self.setProperty("active", state.active)
         self.setProperty("completed", state.completed)
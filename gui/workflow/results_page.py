@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import os
 from html import escape
-from pathlib import Path
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
@@ -26,6 +26,9 @@ FILES_LIST_MIN_HEIGHT = 140
 FILES_LIST_MAX_HEIGHT = 260
 FILE_ENTRY_ESTIMATED_HEIGHT = 56
 FILES_LIST_VERTICAL_PADDING = 12
+FILE_ENTRY_MIN_HEIGHT = 52
+FILE_ENTRY_MARGINS = (12, 7, 18, 7)
+FILE_ENTRY_SPACING = 10
 
 
 class ElidedLabel(QLabel):
@@ -45,7 +48,8 @@ class ElidedLabel(QLabel):
     def resizeEvent(self, event):
         """Recompute elision when label width changes."""
         super().resizeEvent(event)
-        super().setText(self._elided_text())
+        if event.size().width() != event.oldSize().width():
+            super().setText(self._elided_text())
 
     def _elided_text(self) -> str:
         if not self._full_text:
@@ -64,26 +68,21 @@ class ResultsFileEntry(QWidget):
         self._path = path
         self._on_open = on_open
         self.setObjectName("resultsFileEntry")
-        self.setMinimumHeight(52)
+        self.setMinimumHeight(FILE_ENTRY_MIN_HEIGHT)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
         layout = QHBoxLayout(self)
-        layout.setContentsMargins(12, 7, 18, 7)
-        layout.setSpacing(10)
-
-        text_layout = QVBoxLayout()
-        text_layout.setContentsMargins(0, 0, 0, 0)
-        text_layout.setSpacing(2)
+        layout.setContentsMargins(*FILE_ENTRY_MARGINS)
+        layout.setSpacing(FILE_ENTRY_SPACING)
 
+        # The name label sits directly in the row layout; a nested layout per row adds nothing
         self.name_label = ElidedLabel(file_name)
         self.name_label.setObjectName("resultsFileName")
         self.name_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         self.name_label.setToolTip(file_name)
-        text_layout.addWidget(self.name_label)
+        layout.addWidget(self.name_label, 1)
         self.setToolTip(path)
 
-        layout.addLayout(text_layout, 1)
-
         self.open_button = QPushButton(open_label)
         self.open_button.setObjectName("resultsFileOpenButton")
         self.open_button.clicked.connect(self._handle_open)
@@ -150,24 +149,29 @@ class ResultsFilesPanel(QWidget):
 
     def populate_entries(self, *, paths: list[str], open_label: str, on_open, empty_text: str):
         """Populate list widget with file entries (or empty placeholder row)."""
-        self.list_widget.clear()
-        for path in paths:
-            item = QListWidgetItem()
-            item.setFlags(Qt.ItemFlag.NoItemFlags)
-            entry = ResultsFileEntry(
-                file_name=Path(path).name,
-                open_label=open_label,
-                path=path,
-                on_open=on_open,
-            )
-            item.setSizeHint(entry.sizeHint())
-            self.list_widget.addItem(item)
-            self.list_widget.setItemWidget(item, entry)
-        if self.list_widget.count() == 0:
-            placeholder_item = QListWidgetItem(empty_text)
-            placeholder_item.setFlags(Qt.NoItemFlags)
-            self.list_widget.addItem(placeholder_item)
-        self._adjust_list_height(self.list_widget.count())
+        # Rebuild with painting suspended so rows are laid out and repainted once, not per insert
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            self.list_widget.clear()
+            for path in paths:
+                item = QListWidgetItem()
+                item.setFlags(Qt.ItemFlag.NoItemFlags)
+                entry = ResultsFileEntry(
+                    file_name=os.path.basename(path),
+                    open_label=open_label,
+                    path=path,
+                    on_open=on_open,
+                )
+                item.setSizeHint(entry.sizeHint())
+                self.list_widget.addItem(item)
+                self.list_widget.setItemWidget(item, entry)
+            if self.list_widget.count() == 0:
+                placeholder_item = QListWidgetItem(empty_text)
+                placeholder_item.setFlags(Qt.NoItemFlags)
+                self.list_widget.addItem(placeholder_item)
+            self._adjust_list_height(self.list_widget.count())
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
 
     def _adjust_list_height(self, rows: int):
         desired_height = (max(rows, 1) * FILE_ENTRY_ESTIMATED_HEIGHT) + FILES_LIST_VERTICAL_PADDING
@@ -301,20 +305,22 @@ class ResultsPage(WorkflowPage):
 
         split_mode = bool(docx_paths and pdf_paths)
         self.files_count_badge.setVisible(not split_mode)
+        open_label = self.localization.t("button.open")
+        empty_text = self.localization.t("results.files.empty")
 
         if split_mode:
             self.files_view_stack.setCurrentWidget(self.split_files_page)
             self.docx_files_panel.populate_entries(
                 paths=docx_paths,
-                open_label=self.localization.t("button.open"),
+                open_label=open_label,
                 on_open=self._open_path,
-                empty_text=self.localization.t("results.files.empty"),
+                empty_text=empty_text,
             )
             self.pdf_files_panel.populate_entries(
                 paths=pdf_paths,
-                open_label=self.localization.t("button.open"),
+                open_label=open_label,
                 on_open=self._open_path,
-                empty_text=self.localization.t("results.files.empty"),
+                empty_text=empty_text,
             )
             self.docx_files_count_badge.setText(str(len(docx_paths)))
             self.pdf_files_count_badge.setText(str(len(pdf_paths)))
@@ -325,9 +331,9 @@ class ResultsPage(WorkflowPage):
             self.files_view_stack.setCurrentWidget(self.single_files_page)
             self.single_files_panel.populate_entries(
                 paths=[*docx_paths, *pdf_paths],
-                open_label=self.localization.t("button.open"),
+                open_label=open_label,
                 on_open=self._open_path,
-                empty_text=self.localization.t("results.files.empty"),
+                empty_text=empty_text,
             )
             self.docx_files_list.clear()
             self.pdf_files_list.clear()
@@ -7,7 +7,6 @@ from PySide6.QtWidgets import QApplication
 
 from core.config.configuration import Config
 from core.util.app_icon import apply_app_icon_setup, configure_qt_application_identity
-from gui.windows import MainWindow
 
 
 def _has_live_non_daemon_threads() -> bool:
@@ -23,6 +22,8 @@ def _has_live_non_daemon_threads() -> bool:
 
 def _should_force_process_exit(app: QApplication) -> bool:
     """Force process exit when shutdown left background work behind."""
+    from gui.windows import MainWindow
+
     if bool(app.property(MainWindow.FORCE_PROCESS_EXIT_PROPERTY)):
         return True
     return _has_live_non_daemon_threads()
@@ -48,7 +49,9 @@ def main():
         entrypoint_path=Path(__file__).resolve(),
     )
 
-    # 4️ Create and show the main window
+    # 4️ Create and show the main window (the GUI package is imported only once the app exists)
+    from gui.windows import MainWindow
+
     window = MainWindow(config)
     if icon is not None:
         window.setWindowIcon(icon)
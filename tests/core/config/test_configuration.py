@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import core.config.configuration as configuration_module
+from core.config.configuration import Config, _SafeConfig
+
+
+def test_config_get_loads_once_under_concurrent_access(monkeypatch):
+    load_calls: list[int] = []
+
+    class SlowEnvironmentSetup:
+        def load(self):
+            load_calls.append(1)
+            time.sleep(0.05)
+            return {"APP_NAME": "Document Mapper Test"}
+
+    monkeypatch.setattr(configuration_module, "EnvironmentSetup", SlowEnvironmentSetup)
+    monkeypatch.setattr(configuration_module.Resources, "initialize", lambda _cfg: None)
+    monkeypatch.setattr(Config, "_instance", None)
+
+    results: list[_SafeConfig] = []
+    threads = [threading.Thread(target=lambda: results.append(Config.get())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(load_calls) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+    assert results[0]["APP_NAME"] == "Document Mapper Test"
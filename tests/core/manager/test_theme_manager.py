@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import core.manager.theme_manager as theme_manager_module
+
+
+def test_system_dark_mode_detection_is_cached_within_time_bucket(monkeypatch):
+    calls: list[int] = []
+
+    def fake_detect_linux_theme() -> bool:
+        calls.append(1)
+        return True
+
+    monkeypatch.setattr(theme_manager_module, "IS_MACOS", False)
+    monkeypatch.setattr(theme_manager_module, "IS_WINDOWS", False)
+    monkeypatch.setattr(theme_manager_module, "IS_LINUX", True)
+    monkeypatch.setattr(theme_manager_module, "detect_linux_theme", fake_detect_linux_theme)
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(theme_manager_module, "time", SimpleNamespace(monotonic=lambda: clock["now"]))
+    theme_manager_module._detect_system_dark_mode.cache_clear()
+
+    try:
+        assert theme_manager_module.is_system_dark_mode() is True
+        assert theme_manager_module.is_system_dark_mode() is True
+        assert len(calls) == 1
+
+        clock["now"] += theme_manager_module.SYSTEM_THEME_CACHE_SECONDS
+        assert theme_manager_module.is_system_dark_mode() is True
+        assert len(calls) == 2
+    finally:
+        theme_manager_module._detect_system_dark_mode.cache_clear()
+
+
+def test_palettes_are_built_once_and_reused(qapp, monkeypatch):
+    ThemeManager = theme_manager_module.ThemeManager
+    build_calls: list[str] = []
+    original_build_dark = ThemeManager._build_dark_palette
+
+    def counting_build_dark():
+        build_calls.append("dark")
+        return original_build_dark()
+
+    monkeypatch.setattr(ThemeManager, "_dark_palette", None)
+    monkeypatch.setattr(ThemeManager, "_build_dark_palette", staticmethod(counting_build_dark))
+    original_palette = qapp.palette()
+
+    try:
+        ThemeManager._apply_dark_palette()
+        ThemeManager._apply_dark_palette()
+    finally:
+        qapp.setPalette(original_palette)
+
+    assert build_calls == ["dark"]
+    assert ThemeManager._dark_palette is not None
+
+
+def test_coerce_theme_accepts_enums_and_case_insensitive_names():
+    ThemeManager = theme_manager_module.ThemeManager
+    AppTheme = theme_manager_module.AppTheme
+
+    assert ThemeManager._coerce_theme(AppTheme.DARK) is AppTheme.DARK
+    assert ThemeManager._coerce_theme(" light ") is AppTheme.LIGHT
+    assert ThemeManager._coerce_theme("auto") is AppTheme.AUTO
+    assert ThemeManager._coerce_theme("sepia") is None
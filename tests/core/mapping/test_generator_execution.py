@@ -184,3 +184,22 @@ def test_generator_generate_reads_workbook_once_without_inspect(tmp_path):
     assert result.success_count == 1
     assert excel_service.read_calls == 1
     assert excel_service.inspect_calls == 0
+
+
+def test_generator_strips_spire_watermarks_from_xml_parts_only(tmp_path):
+    import zipfile
+
+    docx_path = tmp_path / "output.docx"
+    watermark = "Evaluation Warning: The document was created with Spire.Doc for Python."
+    with zipfile.ZipFile(docx_path, "w") as archive:
+        archive.writestr("word/document.xml", f"<w:t>{watermark}Hello</w:t>")
+        archive.writestr("_rels/.rels", f"<Relationships>{watermark}</Relationships>")
+        archive.writestr("word/media/note.txt", watermark)
+
+    generator = DocumentGenerator(excel_service=FakeExcelService(pd.DataFrame()))
+
+    assert generator._clean_docx_content(docx_path) is True
+    with zipfile.ZipFile(docx_path) as archive:
+        assert archive.read("word/document.xml").decode("utf-8") == "<w:t>Hello</w:t>"
+        assert archive.read("_rels/.rels").decode("utf-8") == "<Relationships></Relationships>"
+        assert archive.read("word/media/note.txt").decode("utf-8") == watermark
@@ -245,3 +245,31 @@ def test_session_store_save_as_copies_existing_managed_templates_from_source_pro
     assert (target_project_dir / "templates" / "Default_template_01.docx").exists()
     assert saved_payload["templates"][0]["relative_path"] == "templates/Default_template_01.docx"
     assert "source_path" not in saved_payload["templates"][0]
+
+
+def test_session_store_save_prunes_unreferenced_managed_templates(tmp_path):
+    project_dir = tmp_path / "project"
+    templates_dir = project_dir / "templates"
+    (templates_dir / "old" / "nested").mkdir(parents=True)
+    (templates_dir / "old" / "nested" / "stale.docx").write_text("stale", encoding="utf-8")
+    kept_template = templates_dir / "Default_template_01.docx"
+    kept_template.write_text("Hello <NAME>", encoding="utf-8")
+
+    template_entry = ProjectTemplateEntry(
+        display_name="Default template 01",
+        type_name="Default template",
+        relative_path="templates/Default_template_01.docx",
+        is_managed=True,
+    )
+    session = ProjectSession(
+        selected_template_type="Default template",
+        selected_template=template_entry.id,
+        template_types=[ProjectTemplateType("Default template")],
+        templates=[template_entry],
+    )
+
+    ProjectSessionStore(tmp_path).save(session, project_dir)
+
+    assert kept_template.exists()
+    assert not (templates_dir / "old").exists()
+    assert templates_dir.is_dir()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import pytest
+
+from core.enums.log_level import LogLevel
+from core.util.logger import Logger
+
+_LOGGER_STATE_ATTRS = (
+    "CONSOLE_OUTPUT_ENABLED",
+    "LEVEL",
+    "_MIN_LEVEL",
+    "PERSISTENCE_LOGGING",
+    "LOG_FILE_PATH",
+    "CONSOLE_FORCE_COLORED",
+    "_COLORS",
+    "RESET",
+    "_CONSOLE_FORMATS",
+    "_FILE_FORMATS",
+)
+
+
+@pytest.fixture
+def isolated_logger(monkeypatch):
+    """Snapshot Logger class state and restore it after the test."""
+    saved = {name: getattr(Logger, name) for name in _LOGGER_STATE_ATTRS}
+    for name in ("CONSOLE_OUTPUT_ENABLED", "PERSISTENCE_LOGGING", "CONSOLE_OUTPUT_LEVEL", "CONSOLE_FORCE_COLORED"):
+        monkeypatch.delenv(name, raising=False)
+    yield Logger
+    Logger._close_log_file()
+    for name, value in saved.items():
+        setattr(Logger, name, value)
+
+
+def test_logger_keeps_single_file_handle_for_persistent_logging(isolated_logger, tmp_path, monkeypatch):
+    monkeypatch.setenv("PERSISTENCE_LOGGING", "true")
+
+    Logger.configure_from_env(tmp_path)
+    handle = Logger._log_file
+    Logger.info("first message", tag="test")
+    Logger.log("second message", LogLevel.WARNING)
+
+    assert handle is not None
+    assert Logger._log_file is handle
+    contents = Logger.LOG_FILE_PATH.read_text(encoding="utf-8")
+    assert "> LOG FILE for" in contents
+    assert "[INFO] [test] first message" in contents
+    assert "[WARNING] second message" in contents
+
+
+def test_logger_reconfigure_closes_previous_file_handle(isolated_logger, tmp_path, monkeypatch):
+    monkeypatch.setenv("PERSISTENCE_LOGGING", "true")
+    Logger.configure_from_env(tmp_path)
+    first_handle = Logger._log_file
+
+    monkeypatch.delenv("PERSISTENCE_LOGGING")
+    Logger.configure_from_env(tmp_path)
+
+    assert first_handle.closed
+    assert Logger._log_file is None
+
+
+def test_logger_shortcuts_skip_formatting_when_level_is_filtered(isolated_logger, monkeypatch):
+    emitted: list[tuple[str, LogLevel]] = []
+    monkeypatch.setattr(Logger, "log", classmethod(lambda cls, message, level=LogLevel.INFO: emitted.append((message, level))))
+    monkeypatch.setattr(Logger, "_format_message", classmethod(lambda cls, msg, tag=None: f"[{tag}] {msg}"))
+    Logger.LEVEL = LogLevel.WARNING
+    Logger._MIN_LEVEL = int(LogLevel.WARNING)
+
+    class ExplodingValue:
+        def __repr__(self):
+            raise AssertionError("filtered log arguments must not be formatted")
+
+    Logger.debug("value: %r", ExplodingValue(), tag="test")
+    Logger.warning("copied %d of %d files", 3, 5, tag="test")
+
+    assert emitted == [("[test] copied 3 of 5 files", LogLevel.WARNING)]
+
+
+def test_logger_without_sinks_skips_timestamp_and_formatting(isolated_logger, tmp_path, monkeypatch):
+    Logger.configure_from_env(tmp_path)
+
+    def fail_timestamp(cls):
+        raise AssertionError("timestamp must not be computed without an active sink")
+
+    monkeypatch.setattr(Logger, "_timestamp", classmethod(fail_timestamp))
+
+    class ExplodingValue:
+        def __repr__(self):
+            raise AssertionError("log arguments must not be formatted without an active sink")
+
+    Logger.critical("value: %r", ExplodingValue(), tag="test")
+    Logger.log("plain message", LogLevel.CRITICAL)
+
+
+def test_logger_console_lines_use_precomputed_level_formats(isolated_logger, monkeypatch, capsys):
+    monkeypatch.setattr(Logger, "_timestamp", classmethod(lambda cls: "2024-01-01 00:00:00"))
+    Logger.CONSOLE_OUTPUT_ENABLED = True
+    Logger.LEVEL = LogLevel.DEBUG
+    Logger._MIN_LEVEL = int(LogLevel.DEBUG)
+    Logger._COLORS = {level: "<c>" for level in LogLevel}
+    Logger.RESET = "</c>"
+    Logger._build_line_formats()
+
+    Logger.log("100% done", LogLevel.ERROR)
+
+    assert capsys.readouterr().out == "<c>[2024-01-01 00:00:00] [ERROR] 100% done</c>\n"
+
+
+def test_logger_timestamp_is_formatted_once_per_second(isolated_logger, monkeypatch):
+    import time
+    from types import SimpleNamespace
+
+    import core.util.logger as logger_module
+
+    clock = {"now": 1_700_000_000.25}
+    strftime_calls: list[int] = []
+
+    def counting_strftime(fmt, value):
+        strftime_calls.append(1)
+        return time.strftime(fmt, value)
+
+    fake_time = SimpleNamespace(time=lambda: clock["now"], strftime=counting_strftime, localtime=time.localtime)
+    monkeypatch.setattr(logger_module, "time", fake_time)
+    monkeypatch.setattr(Logger, "_timestamp_cache", (-1, ""))
+
+    first = Logger._timestamp()
+    clock["now"] = 1_700_000_000.75
+    second = Logger._timestamp()
+    clock["now"] = 1_700_000_001.0
+    third = Logger._timestamp()
+
+    assert first == second
+    assert third != first
+    assert len(strftime_calls) == 2
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
+import pytest
+
 import core.util.app_icon as app_icon_module
 from core.config.environment_setup import EnvironmentSetup
 from core.util.app_icon import (
@@ -36,7 +39,7 @@ def test_resources_resolve_from_project_root_not_cwd(tmp_path, monkeypatch):
             "RESOURCES_ICONS": "resources/icons",
         }
     )
-    icon_path = Path(Resources.get_in_icons("sys/chevron_down.svg"))
+    icon_path = Path(Resources.get_in("icons", "sys/chevron_down.svg"))
 
     assert icon_path.exists()
     assert str(icon_path).startswith(str(AppPaths.project_root()))
@@ -101,6 +104,43 @@ def test_main_resolves_app_icon_from_resources_icons():
     assert icon_path.exists()
 
 
+def test_apply_app_icon_setup_resolves_icon_candidates_once(qapp, monkeypatch):
+    resolve_calls: list[int] = []
+    icon_path = resolve_app_icon_path()
+
+    def counting_resolve():
+        resolve_calls.append(1)
+        return [icon_path]
+
+    monkeypatch.setattr(app_icon_module, "resolve_app_icon_paths", counting_resolve)
+    monkeypatch.setattr(app_icon_module, "ensure_linux_desktop_integration", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(qapp, "setWindowIcon", lambda _icon: None)
+
+    icon = app_icon_module.apply_app_icon_setup(qapp, app_name="Document Mapper")
+
+    assert icon is not None
+    assert len(resolve_calls) == 1
+
+
+def test_launcher_icon_refresh_checks_missing_empty_and_stale_targets(tmp_path):
+    source_icon = tmp_path / "source.ico"
+    source_icon.write_bytes(b"icon")
+    target_png = tmp_path / "launcher.png"
+
+    assert app_icon_module._should_refresh_launcher_icon(source_icon, target_png) is True
+
+    target_png.write_bytes(b"")
+    assert app_icon_module._should_refresh_launcher_icon(source_icon, target_png) is True
+
+    target_png.write_bytes(b"png")
+    source_mtime = source_icon.stat().st_mtime
+    os.utime(target_png, (source_mtime - 10, source_mtime - 10))
+    assert app_icon_module._should_refresh_launcher_icon(source_icon, target_png) is True
+
+    os.utime(target_png, (source_mtime + 10, source_mtime + 10))
+    assert app_icon_module._should_refresh_launcher_icon(source_icon, target_png) is False
+
+
 def test_qt_application_identity_uses_desktop_basename(monkeypatch):
     captured: dict[str, str] = {}
 
@@ -224,3 +264,155 @@ def test_qt_application_identity_sets_windows_app_user_model_id(monkeypatch):
         "windows_app_user_model_id": "com.github.younesrabeh.documentmapper",
     }
     assert integration.platform == "windows"
+
+
+def test_environment_setup_overrides_only_keys_declared_in_env_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, "environ", os.environ.copy())
+    env_file = tmp_path / ".env"
+    env_file.write_text("WINDOW_WIDTH=1024\n", encoding="utf-8")
+    monkeypatch.setenv("WINDOW_HEIGHT", "900")
+
+    setup = EnvironmentSetup(env_path=str(env_file))
+    config = setup.load()
+
+    assert setup.env_values == {"WINDOW_WIDTH": "1024"}
+    assert config["WINDOW_WIDTH"] == 1024
+    assert config["WINDOW_HEIGHT"] == setup.toml_data["window"]["height"]
+
+
+def test_environment_setup_auto_cast_infers_basic_types():
+    setup = EnvironmentSetup()
+
+    assert setup._auto_cast("WINDOW_TITLE", "Document Mapper") == "Document Mapper"
+    assert setup._auto_cast("LOGGING_PERSISTENCE_LOGGING", "Off") is False
+    assert setup._auto_cast("LOGGING_PERSISTENCE_LOGGING", "yes") is True
+    assert setup._auto_cast("WINDOW_WIDTH", "1280") == 1280
+    assert setup._auto_cast("DOCUMENT_MAPPER_TEST_COUNT", "-5") == "-5"
+
+
+def test_environment_setup_auto_cast_uses_schema_for_known_keys():
+    setup = EnvironmentSetup()
+
+    assert setup._auto_cast("APP_VERSION", "4") == "4"
+    assert setup._auto_cast("WINDOW_THEME_MODE", "dark") == "DARK"
+    with pytest.raises(ValueError):
+        setup._auto_cast("WINDOW_WIDTH", "-5")
+    with pytest.raises(ValueError):
+        setup._auto_cast("LOGGING_PERSISTENCE_LOGGING", "maybe")
+
+
+def test_resources_list_files_walks_nested_directories(tmp_path):
+    (tmp_path / "nested" / "deeper").mkdir(parents=True)
+    (tmp_path / "top.qss").write_text("", encoding="utf-8")
+    (tmp_path / "nested" / "deeper" / "icon.svg").write_text("", encoding="utf-8")
+
+    files = Resources._list_files(str(tmp_path))
+
+    assert sorted(Path(path).relative_to(tmp_path).as_posix() for path in files) == [
+        "nested/deeper/icon.svg",
+        "top.qss",
+    ]
+    assert Resources._list_files(str(tmp_path / "missing")) == []
+
+
+def test_resources_index_directories_only_on_first_access(tmp_path, monkeypatch):
+    listed: list[str] = []
+    original_list_files = Resources._list_files.__func__
+
+    def tracking_list_files(cls, directory):
+        listed.append(str(directory))
+        return original_list_files(cls, directory)
+
+    monkeypatch.setattr(Resources, "_list_files", classmethod(tracking_list_files))
+    qss_dir = tmp_path / "qss"
+    qss_dir.mkdir()
+    (qss_dir / "main.qss").write_text("", encoding="utf-8")
+
+    try:
+        Resources.initialize({"RESOURCES_BASE": "resources", "RESOURCES_QSS": str(qss_dir)})
+        assert listed == []
+
+        assert Resources.get_all_in("qss") == [str(qss_dir / "main.qss")]
+        assert Resources.get_all_in("qss") == [str(qss_dir / "main.qss")]
+        assert listed == [str(qss_dir.resolve())]
+    finally:
+        Resources.initialize({"RESOURCES_BASE": "resources", "RESOURCES_QSS": "resources/qss"})
+
+
+def test_resources_reinitialize_picks_up_files_added_after_first_scan(tmp_path):
+    qss_dir = tmp_path / "qss"
+    qss_dir.mkdir()
+    (qss_dir / "main.qss").write_text("", encoding="utf-8")
+
+    try:
+        Resources.initialize({"RESOURCES_BASE": "resources", "RESOURCES_QSS": str(qss_dir)})
+        assert [Path(path).name for path in Resources.get_all_in("qss")] == ["main.qss"]
+
+        (qss_dir / "extra.qss").write_text("", encoding="utf-8")
+        Resources.initialize({"RESOURCES_BASE": "resources", "RESOURCES_QSS": str(qss_dir)})
+
+        assert sorted(Path(path).name for path in Resources.get_all_in("qss")) == ["extra.qss", "main.qss"]
+        assert Resources.get_in("qss", "extra.qss") == str((qss_dir / "extra.qss").resolve())
+    finally:
+        Resources.initialize({"RESOURCES_BASE": "resources", "RESOURCES_QSS": "resources/qss"})
+
+
+def test_resources_get_in_resolves_relative_paths_and_unique_file_names(tmp_path):
+    qss_dir = tmp_path / "qss"
+    (qss_dir / "elements").mkdir(parents=True)
+    (qss_dir / "other").mkdir()
+    (qss_dir / "elements" / "entry.qss").write_text("", encoding="utf-8")
+    (qss_dir / "elements" / "shared.qss").write_text("", encoding="utf-8")
+    (qss_dir / "other" / "shared.qss").write_text("", encoding="utf-8")
+
+    try:
+        Resources.initialize({"RESOURCES_BASE": "resources", "RESOURCES_QSS": str(qss_dir)})
+
+        expected_entry = str((qss_dir / "elements" / "entry.qss").resolve())
+        assert Resources.get_in("qss", "elements/entry.qss") == expected_entry
+        assert Resources.get_in("qss", "entry.qss") == expected_entry
+        assert Resources.get_in("qss", "other/shared.qss") == str((qss_dir / "other" / "shared.qss").resolve())
+        assert Resources.get_in("qss", "shared.qss", suppress=True) is None
+    finally:
+        Resources.initialize({"RESOURCES_BASE": "resources", "RESOURCES_QSS": "resources/qss"})
+
+
+def test_environment_setup_auto_cast_only_treats_path_suffixed_keys_as_paths(tmp_path):
+    setup = EnvironmentSetup()
+    plain_dir = tmp_path / "plain"
+    opt_in_dir = tmp_path / "created"
+
+    assert setup._auto_cast("APP_PATHS", "some/value") == "some/value"
+    assert setup._auto_cast("OUTPUT_DIR", str(plain_dir)) == str(plain_dir.resolve())
+    assert plain_dir.exists() is False
+    assert setup._auto_cast("CACHE_PATH_CREATE", str(opt_in_dir)) == str(opt_in_dir.resolve())
+    assert opt_in_dir.is_dir()
+
+
+def test_environment_setup_reports_unknown_and_invalid_env_keys_once(tmp_path, monkeypatch):
+    import core.config.environment_setup as environment_setup_module
+
+    monkeypatch.setattr(os, "environ", os.environ.copy())
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "WINDOW_THEME_MDOE=dark\nCONSOLE_OUTPUT_ENABLED=false\nWINDOW_WIDTH=wide\nWINDOW_MIN_WIDTH=0\n",
+        encoding="utf-8",
+    )
+    warnings: list[str] = []
+    monkeypatch.setattr(
+        environment_setup_module.Logger,
+        "warning",
+        classmethod(lambda cls, msg, *args, tag=None: warnings.append(msg)),
+    )
+
+    setup = EnvironmentSetup(env_path=str(env_file))
+    config = setup.load()
+
+    toml_window = setup.toml_data["window"]
+    assert config["WINDOW_WIDTH"] == toml_window["width"]
+    assert config["WINDOW_MIN_WIDTH"] == toml_window["min_width"]
+    assert len(warnings) == 2
+    assert "WINDOW_THEME_MDOE" in warnings[0]
+    assert "CONSOLE_OUTPUT_ENABLED" not in warnings[0]
+    assert "WINDOW_WIDTH='wide'" in warnings[1]
+    assert "WINDOW_MIN_WIDTH='0'" in warnings[1]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import core.util.system_info as system_info
+
+
+def _forbid_subprocess_detection(monkeypatch):
+    def fail():
+        raise AssertionError("subprocess-based detection must not run")
+
+    monkeypatch.setattr(system_info, "_detect_qt_color_scheme_dark", lambda: None)
+    monkeypatch.setattr(system_info, "_detect_gtk_dark", fail)
+    monkeypatch.setattr(system_info, "_detect_kde_dark", fail)
+
+
+def test_linux_theme_uses_gtk_theme_env_without_subprocess(monkeypatch, tmp_path):
+    _forbid_subprocess_detection(monkeypatch)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setenv("GTK_THEME", "Adwaita:dark")
+
+    assert system_info.detect_linux_theme() is True
+
+
+def test_linux_theme_reads_gtk_settings_ini(monkeypatch, tmp_path):
+    _forbid_subprocess_detection(monkeypatch)
+    monkeypatch.delenv("GTK_THEME", raising=False)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    settings_dir = tmp_path / "gtk-3.0"
+    settings_dir.mkdir()
+    settings_file = settings_dir / "settings.ini"
+
+    settings_file.write_text("[Settings]\ngtk-application-prefer-dark-theme=1\n", encoding="utf-8")
+    assert system_info.detect_linux_theme() is True
+
+    settings_file.write_text(
+        "[Settings]\ngtk-theme-name=Adwaita-dark\ngtk-application-prefer-dark-theme=false\n",
+        encoding="utf-8",
+    )
+    assert system_info.detect_linux_theme() is False
+
+
+def test_linux_theme_light_gtk_theme_name_falls_through_to_gsettings(monkeypatch, tmp_path):
+    calls: list[str] = []
+    monkeypatch.setattr(system_info, "_detect_qt_color_scheme_dark", lambda: None)
+    monkeypatch.setattr(system_info, "_detect_gtk_dark", lambda: calls.append("gtk") or True)
+    monkeypatch.setattr(system_info, "_detect_kde_dark", lambda: calls.append("kde") or False)
+    monkeypatch.setenv("GTK_THEME", "Adwaita")
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    settings_dir = tmp_path / "gtk-3.0"
+    settings_dir.mkdir()
+    (settings_dir / "settings.ini").write_text("[Settings]\ngtk-theme-name=Adwaita\n", encoding="utf-8")
+
+    assert system_info.detect_linux_theme() is True
+    assert calls == ["gtk"]
+
+
+def test_linux_theme_falls_back_to_subprocess_detection(monkeypatch, tmp_path):
+    calls: list[str] = []
+    monkeypatch.setattr(system_info, "_detect_qt_color_scheme_dark", lambda: None)
+    monkeypatch.setattr(system_info, "_detect_gtk_dark", lambda: calls.append("gtk") or False)
+    monkeypatch.setattr(system_info, "_detect_kde_dark", lambda: calls.append("kde") or True)
+    monkeypatch.delenv("GTK_THEME", raising=False)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+    assert system_info.detect_linux_theme() is True
+    assert calls == ["gtk", "kde"]
+
+
+def test_linux_theme_unreadable_gtk_settings_ini_falls_through_to_gsettings(monkeypatch, tmp_path):
+    calls: list[str] = []
+    monkeypatch.setattr(system_info, "_detect_qt_color_scheme_dark", lambda: None)
+    monkeypatch.setattr(system_info, "_detect_gtk_dark", lambda: calls.append("gtk") or True)
+    monkeypatch.setattr(system_info, "_detect_kde_dark", lambda: calls.append("kde") or False)
+    monkeypatch.delenv("GTK_THEME", raising=False)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    settings_dir = tmp_path / "gtk-3.0"
+    settings_dir.mkdir()
+    (settings_dir / "settings.ini").write_bytes(b"[Settings]\ngtk-theme-name=Caf\xe9\n")
+
+    assert system_info.detect_linux_theme() is True
+    assert calls == ["gtk"]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import gui.styles as styles_module
+from gui.styles import load_stylesheet
+
+
+def test_load_stylesheet_reads_each_qss_file_once(monkeypatch):
+    reads: list[Path] = []
+    original_read_text = Path.read_text
+
+    def tracking_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    styles_module._read_stylesheet.cache_clear()
+    monkeypatch.setattr(Path, "read_text", tracking_read_text)
+    try:
+        first = load_stylesheet("workflow_page")
+        second = load_stylesheet("workflow_page")
+    finally:
+        styles_module._read_stylesheet.cache_clear()
+
+    assert first == second
+    assert "__COMBO_ARROW_PATH__" not in first
+    assert [path.name for path in reads] == ["workflow_page.qss"]
+
+
+def test_combo_arrow_path_is_resolved_once(monkeypatch):
+    lookups: list[tuple[str, str]] = []
+    original_get_in = styles_module.Resources.get_in
+
+    def tracking_get_in(kind, path, suppress=False):
+        lookups.append((kind, path))
+        return original_get_in(kind, path, suppress=True)
+
+    styles_module._combo_arrow_path.cache_clear()
+    monkeypatch.setattr(styles_module.Resources, "has", lambda kind: True)
+    monkeypatch.setattr(styles_module.Resources, "get_in", tracking_get_in)
+    try:
+        first = styles_module._combo_arrow_path()
+        second = styles_module._combo_arrow_path()
+    finally:
+        styles_module._combo_arrow_path.cache_clear()
+
+    assert first == second
+    assert first.endswith("sys/chevron_down.svg")
+    assert lookups == [("icons", "sys/chevron_down.svg")]
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from core.manager.localization_manager import LocalizationManager
+from gui.controllers import WorkflowStageState
+from gui.windows.components import SidebarStageCard
+
+
+def test_sidebar_stage_card_repolishes_only_when_flags_change(qapp, monkeypatch):
+    card = SidebarStageCard(1, "stage.setup.title", "stage.setup.detail", LocalizationManager({}))
+    repolished: list[object] = []
+    original_update = SidebarStageCard.update
+
+    def tracking_update(self, *args):
+        repolished.append(self)
+        return original_update(self, *args)
+
+    monkeypatch.setattr(SidebarStageCard, "update", tracking_update)
+
+    card.set_stage_state(WorkflowStageState(active=True))
+    card.set_stage_state(WorkflowStageState(active=True))
+    assert repolished == [card]
+    assert card.property("active") is True
+
+    card.set_stage_state(WorkflowStageState(blocked=True))
+    assert repolished == [card, card]
+    assert card.property("blocked") is True
+    assert card.property("active") is False
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from gui.workflow.results_page import ElidedLabel
+
+
+def test_elided_label_recomputes_elision_only_on_width_changes(qapp, monkeypatch):
+    label = ElidedLabel("a-very-long-generated-file-name.docx")
+    label.resize(120, 20)
+    label.show()
+    qapp.processEvents()
+
+    calls: list[int] = []
+    original_elided_text = ElidedLabel._elided_text
+
+    def tracking_elided_text(self):
+        calls.append(self.width())
+        return original_elided_text(self)
+
+    monkeypatch.setattr(ElidedLabel, "_elided_text", tracking_elided_text)
+    try:
+        label.resize(120, 40)
+        qapp.processEvents()
+        assert calls == []
+
+        label.resize(60, 40)
+        qapp.processEvents()
+        assert calls == [60]
+        assert label.text() != "a-very-long-generated-file-name.docx"
+    finally:
+        label.close()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import threading
 
 import main as main_module
+from gui.windows import MainWindow
 
 
 class _FakeApp:
@@ -10,7 +11,7 @@ class _FakeApp:
         self._force_process_exit = force_process_exit
 
     def property(self, name: str):
-        if name == main_module.MainWindow.FORCE_PROCESS_EXIT_PROPERTY:
+        if name == MainWindow.FORCE_PROCESS_EXIT_PROPERTY:
             return self._force_process_exit
         return None
 
@@ -61,3 +62,20 @@ def test_should_force_process_exit_uses_thread_fallback(monkeypatch):
     monkeypatch.setattr(main_module, "_has_live_non_daemon_threads", lambda: True)
 
     assert main_module._should_force_process_exit(_FakeApp(force_process_exit=False)) is True
+
+
+def test_main_module_defers_gui_window_import():
+    import os
+    import subprocess
+    import sys
+
+    probe = "import sys, main; print('gui.windows' in sys.modules)"
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(main_module.__file__)),
+    )
+
+    assert completed.stdout.strip() == "False"